@@ -2,14 +2,77 @@
 AI Decision Engine API Endpoints
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from sqlalchemy import bindparam, func, select
 from services.ai_decision_engine import AIDecisionEngine
 from models.ai_decision import AIDecision
 from database import db
+from serialization import fast_json
+from api.pagination import keyset_after, keyset_order, make_cursor, parse_cursor
 
 decisions_bp = Blueprint('decisions', __name__)
 
+# Column names per ?fields= view, in table order; used to pack raw result rows without ORM hydration
+_FIELD_SETS = {
+    'full': tuple(AIDecision.__table__.columns.keys()),
+    'summary': AIDecision.SUMMARY_FIELDS,
+}
+
+def _history_base(by_mission, fields='full'):
+    stmt = select(*(AIDecision.__table__.c[name] for name in _FIELD_SETS[fields]))
+    if by_mission:
+        stmt = stmt.where(AIDecision.mission_id == bindparam('mission_id'))
+    return stmt
+
+@lru_cache(maxsize=None)
+def _history_stmt(by_mission, fields, paged, null_ts=False):
+    """History page query, built once per shape; values are supplied as bind parameters"""
+    stmt = _history_base(by_mission, fields)
+    if paged:
+        stmt = stmt.where(keyset_after(AIDecision.timestamp, AIDecision.id, null_ts))
+    return stmt.order_by(*keyset_order(AIDecision.timestamp, AIDecision.id)).limit(bindparam('limit', type_=db.Integer))
+
+@lru_cache(maxsize=None)
+def _history_count_stmt(by_mission):
+    return select(func.count()).select_from(_history_base(by_mission).subquery())
+
+# Stateless service, built once per worker and shared across requests
+_ai_engine = AIDecisionEngine()
+
+# Explanations keyed by (id, timestamp), oldest evicted first
+_EXPLANATION_CACHE_SIZE = 1024
+_explanations = OrderedDict()
+
+def _cached_explanation(decision):
+    """Explanation for one version of a decision (a to_dict() result); a changed timestamp is recomputed"""
+    key = (decision['id'], decision['timestamp'])
+    explanation = _explanations.get(key)
+    if explanation is None:
+        explanation = _explanations[key] = _ai_engine.generate_detailed_explanation(decision)
+        if len(_explanations) > _EXPLANATION_CACHE_SIZE:
+            _explanations.popitem(last=False)
+    return explanation
+
+# Decision audit rows are written off the request path
+_log_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='decision-log')
+
+def _persist_decision(app, fields):
+    """Insert one AIDecision row using its own app context and session"""
+    with app.app_context():
+        try:
+            db.session.add(AIDecision(**fields))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            app.logger.exception("Failed to log AI decision")
+
+def _log_decision(**fields):
+    _log_pool.submit(_persist_decision, current_app._get_current_object(), fields)
+
 @decisions_bp.route('/analyze', methods=['POST'])
 def analyze_decision():
     """Analyze situation and generate AI decision"""
@@ -29,35 +92,32 @@ def analyze_decision():
             })
         }
         
-        ai_engine = AIDecisionEngine()
-        decision_result = ai_engine.analyze_and_decide(context)
+        decision_result = _ai_engine.analyze_and_decide(context)
+        reasoning = decision_result.get('reasoning', '')
+        confidence = decision_result.get('confidence', 0.0)
         
-        # Log the decision
-        ai_decision = AIDecision(
+        # Log the decision in the background; its id is not known yet
+        _log_decision(
             mission_id=context['mission_id'],
             decision_type='trajectory_optimization',
             context_data=context,
             decision_data=decision_result,
-            reasoning=decision_result.get('reasoning', ''),
-            confidence_score=decision_result.get('confidence', 0.0),
+            reasoning=reasoning,
+            confidence_score=confidence,
             timestamp=datetime.utcnow()
         )
         
-        db.session.add(ai_decision)
-        db.session.commit()
-        
         return jsonify({
             'success': True,
             'decision': decision_result,
-            'decision_id': ai_decision.id,
-            'alternatives': decision_result.get('alternatives', []),
+            'decision_id': None,
+            'alternatives': decision_result.get('alternatives', ()),
             'trade_offs': decision_result.get('trade_offs', {}),
-            'reasoning': decision_result.get('reasoning', ''),
-            'confidence': decision_result.get('confidence', 0.0)
+            'reasoning': reasoning,
+            'confidence': confidence
         })
         
     except Exception as e:
-        db.session.rollback()
         return jsonify({
             'success': False,
             'error': str(e)
@@ -65,22 +125,38 @@ def analyze_decision():
 
 @decisions_bp.route('/history', methods=['GET'])
 def get_decision_history():
-    """Get AI decision history"""
+    """Get AI decision history, newest first, one keyset page at a time"""
     try:
         mission_id = request.args.get('mission_id')
-        limit = int(request.args.get('limit', 50))
-        
-        query = AIDecision.query
+        limit = max(1, int(request.args.get('limit', 50)))
+        cursor = request.args.get('cursor')
+        fields = request.args.get('fields', 'full')
+        if fields not in _FIELD_SETS:
+            raise ValueError(f"Unknown fields: {fields}")
+        columns = _FIELD_SETS[fields]
+        
+        # Fetch one extra row to know whether another page exists
+        params = {'limit': limit + 1}
         if mission_id:
-            query = query.filter_by(mission_id=mission_id)
-            
-        decisions = query.order_by(AIDecision.timestamp.desc()).limit(limit).all()
-        
-        return jsonify({
+            params['mission_id'] = mission_id
+        if cursor:
+            params['cur_ts'], params['cur_id'] = parse_cursor(cursor)
+        null_ts = bool(cursor) and params['cur_ts'] is None
+        rows = db.session.execute(_history_stmt(bool(mission_id), fields, bool(cursor), null_ts), params).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        response = {
             'success': True,
-            'decisions': [decision.to_dict() for decision in decisions],
-            'count': len(decisions)
-        })
+            'decisions': [dict(zip(columns, row)) for row in rows],
+            'count': len(rows),
+            'next_cursor': make_cursor(rows[-1].timestamp, rows[-1].id) if has_more else None
+        }
+        if request.args.get('include_count') == '1':
+            response['total'] = db.session.execute(
+                _history_count_stmt(bool(mission_id)), params
+            ).scalar()
+        return fast_json(response)
         
     except Exception as e:
         return jsonify({
@@ -101,11 +177,10 @@ def trigger_replanning():
             'emergency_level': data.get('emergency_level', 'low')  # low, medium, high, critical
         }
         
-        ai_engine = AIDecisionEngine()
-        replan_result = ai_engine.autonomous_replan(context)
+        replan_result = _ai_engine.autonomous_replan(context)
         
-        # Log replanning decision
-        ai_decision = AIDecision(
+        # Log replanning decision in the background
+        _log_decision(
             mission_id=context['mission_id'],
             decision_type='autonomous_replan',
             context_data=context,
@@ -115,9 +190,6 @@ def trigger_replanning():
             timestamp=datetime.utcnow()
         )
         
-        db.session.add(ai_decision)
-        db.session.commit()
-        
         return jsonify({
             'success': True,
             'replan_result': replan_result,
@@ -128,7 +200,6 @@ def trigger_replanning():
         })
         
     except Exception as e:
-        db.session.rollback()
         return jsonify({
             'success': False,
             'error': str(e)
@@ -138,17 +209,16 @@ def trigger_replanning():
 def explain_decision(decision_id):
     """Get detailed explanation of a specific decision"""
     try:
-        decision = AIDecision.query.get_or_404(decision_id)
+        decision = AIDecision.query.get_or_404(decision_id).to_dict()
         
-        ai_engine = AIDecisionEngine()
-        explanation = ai_engine.generate_detailed_explanation(decision.to_dict())
+        explanation = _cached_explanation(decision)
         
         return jsonify({
             'success': True,
-            'decision': decision.to_dict(),
+            'decision': decision,
             'explanation': explanation,
-            'reasoning_tree': explanation.get('reasoning_tree', []),
-            'alternative_analysis': explanation.get('alternatives_considered', [])
+            'reasoning_tree': explanation.get('reasoning_tree', ()),
+            'alternative_analysis': explanation.get('alternatives_considered', ())
         })
         
     except Exception as e:
@@ -4,11 +4,31 @@ Mission Management API Endpoints
 
 from flask import Blueprint, request, jsonify
 from datetime import datetime
+from functools import lru_cache
+from sqlalchemy import bindparam, func, select
 from models.mission import Mission
 from database import db
+from serialization import fast_json
+from api.pagination import keyset_after, keyset_order, make_cursor, parse_cursor
 
 missions_bp = Blueprint('missions', __name__)
 
+# Column names per ?fields= view, in table order; used to pack raw result rows without ORM hydration
+_FIELD_SETS = {
+    'full': tuple(Mission.__table__.columns.keys()),
+    'summary': Mission.SUMMARY_FIELDS,
+}
+
+@lru_cache(maxsize=None)
+def _list_stmt(fields, paged, null_ts=False):
+    """Mission page query, built once per shape; values are supplied as bind parameters"""
+    stmt = select(*(Mission.__table__.c[name] for name in _FIELD_SETS[fields]))
+    if paged:
+        stmt = stmt.where(keyset_after(Mission.created_at, Mission.id, null_ts))
+    return stmt.order_by(*keyset_order(Mission.created_at, Mission.id)).limit(bindparam('limit', type_=db.Integer))
+
+_COUNT_STMT = select(func.count()).select_from(Mission)
+
 @missions_bp.route('/create', methods=['POST'])
 def create_mission():
     """Create a new mission"""
@@ -70,14 +90,33 @@ def get_mission_status(mission_id):
 
 @missions_bp.route('/', methods=['GET'])
 def list_missions():
-    """List all missions"""
+    """List missions, newest first, one keyset page at a time"""
     try:
-        missions = Mission.query.order_by(Mission.created_at.desc()).all()
-        return jsonify({
+        limit = max(1, int(request.args.get('limit', 50)))
+        cursor = request.args.get('cursor')
+        fields = request.args.get('fields', 'full')
+        if fields not in _FIELD_SETS:
+            raise ValueError(f"Unknown fields: {fields}")
+        columns = _FIELD_SETS[fields]
+        
+        # Fetch one extra row to know whether another page exists
+        params = {'limit': limit + 1}
+        if cursor:
+            params['cur_ts'], params['cur_id'] = parse_cursor(cursor)
+        null_ts = bool(cursor) and params['cur_ts'] is None
+        rows = db.session.execute(_list_stmt(fields, bool(cursor), null_ts), params).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        response = {
             'success': True,
-            'missions': [mission.to_dict() for mission in missions],
-            'count': len(missions)
-        })
+            'missions': [dict(zip(columns, row)) for row in rows],
+            'count': len(rows),
+            'next_cursor': make_cursor(rows[-1].created_at, rows[-1].id) if has_more else None
+        }
+        if request.args.get('include_count') == '1':
+            response['total'] = db.session.execute(_COUNT_STMT).scalar()
+        return fast_json(response)
         
     except Exception as e:
         return jsonify({
@@ -0,0 +1,33 @@
+"""
+Keyset (seek) pagination helpers shared by list endpoints
+"""
+
+from datetime import datetime
+from sqlalchemy import DateTime, Integer, and_, bindparam, or_, tuple_
+
+# Stands in for the timestamp in cursors of rows whose sort timestamp is NULL
+NULL_TS = 'null'
+
+def make_cursor(ts, row_id):
+    """Encode the sort key of the last row on a page as an opaque cursor"""
+    return f"{ts.isoformat() if ts is not None else NULL_TS}_{row_id}"
+
+def parse_cursor(cursor):
+    """Decode a cursor produced by make_cursor into (timestamp, id); timestamp is None for a NULL sort key"""
+    ts_str, _, id_str = cursor.rpartition('_')
+    if not ts_str:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return (None if ts_str == NULL_TS else datetime.fromisoformat(ts_str)), int(id_str)
+
+def keyset_order(ts_col, id_col):
+    """Page order: newest first, rows with a NULL timestamp ahead of all others (as PostgreSQL sorts DESC)"""
+    return ts_col.desc().nulls_first(), id_col.desc()
+
+def keyset_after(ts_col, id_col, null_ts=False):
+    """Rows past the cursor in keyset_order; null_ts when the cursor row's timestamp is NULL"""
+    cur_id = bindparam('cur_id', type_=Integer)
+    if null_ts:
+        # Rest of the NULL block, then every timestamped row
+        return or_(and_(ts_col.is_(None), id_col < cur_id), ts_col.is_not(None))
+    # NULL timestamps compare as unknown and drop out; they were all served before this cursor
+    return tuple_(ts_col, id_col) < tuple_(bindparam('cur_ts', type_=DateTime), cur_id)
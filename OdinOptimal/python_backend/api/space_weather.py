@@ -3,30 +3,46 @@ Space Weather API Endpoints (historical dataset ingest and queries)
 """
 
 from flask import Blueprint, request, jsonify
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-import requests
+from functools import lru_cache
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import load_only
 
 from database import db
+
 from models.space_weather import SpaceWeather
 from services.space_weather import SpaceWeatherService
+from services.space_weather_ingest import parse_iso_date
+from tasks import ingest_space_weather_task
 
 space_weather_bp = Blueprint("space_weather", __name__)
 
+# Stateless service, built once per worker and shared across requests
+_space_weather = SpaceWeatherService()
+
+# start/end strings repeat across paginated queries; datetimes are immutable so sharing is safe
+_parse_query_date = lru_cache(maxsize=1024)(parse_iso_date)
 
-def _parse_iso_date(value: str) -> datetime:
-  try:
-    return datetime.fromisoformat(value)
-  except Exception:
-    # Accept YYYY-MM-DD
-    return datetime.strptime(value, "%Y-%m-%d")
+
+@lru_cache(maxsize=None)
+def _events_stmt(has_start: bool, has_end: bool, include_raw: bool):
+  """Event range query, built once per shape; values are supplied as bind parameters"""
+  stmt = select(SpaceWeather)
+  if not include_raw:
+    stmt = stmt.options(load_only(*(getattr(SpaceWeather, name) for name in SpaceWeather.SUMMARY_FIELDS)))
+  if has_start:
+    stmt = stmt.where(SpaceWeather.timestamp >= bindparam("start"))
+  if has_end:
+    stmt = stmt.where(SpaceWeather.timestamp <= bindparam("end"))
+  return stmt.order_by(SpaceWeather.timestamp.asc()).limit(bindparam("limit", type_=db.Integer))
 
 
 @space_weather_bp.route("/ingest", methods=["POST"])
 def ingest_space_weather():
-  """Ingest the provided historical space weather dataset into the DB.
+  """Queue ingest of the provided historical space weather dataset into the DB.
   Body: { "url": "https://.../space_weather_data.json" }
   Stores major_events as rows in SpaceWeather with timestamp and solar_events JSON.
+  Returns 202 with a job_id to poll at /ingest/<job_id>; without a broker the
+  job runs inline and the ingest summary is returned directly.
   """
   try:
     payload = request.get_json(force=True) or {}
@@ -34,77 +50,62 @@ def ingest_space_weather():
     if not url:
       return jsonify({"success": False, "error": "Missing url"}), 400
 
-    r = requests.get(url, timeout=30)
-    r.raise_for_status()
-    data: Dict[str, Any] = r.json()
-
-    major_events: List[Dict[str, Any]] = data.get("major_events") or []
-    if not isinstance(major_events, list):
-      return jsonify({"success": False, "error": "major_events is not a list"}), 400
-
-    rows: List[SpaceWeather] = []
-    for ev in major_events:
-      date_str: Optional[str] = ev.get("date") or ev.get("timestamp")
-      if not date_str:
-        continue
-      try:
-        ts = _parse_iso_date(date_str)
-      except Exception:
-        continue
-      # Map severity to an approximate radiation_level (arbitrary but consistent)
-      sev = (ev.get("severity") or "").upper()
-      rad = {"LOW": 0.05, "MODERATE": 0.15, "MEDIUM": 0.15, "HIGH": 0.35, "CRITICAL": 0.6}.get(sev, None)
-      row = SpaceWeather(
-        timestamp=ts,
-        solar_flux=None,
-        geomagnetic_index=None,
-        solar_events=ev,  # store full event payload
-        radiation_level=rad,
-      )
-      rows.append(row)
-
-    if rows:
-      db.session.bulk_save_objects(rows)
-      db.session.commit()
-
-    # Return some context from metadata if present
-    meta = data.get("metadata") or {}
+    job = ingest_space_weather_task.delay(url)
+    if job.ready():
+      # Eager mode (no broker configured): the ingest already ran in this request
+      if job.failed():
+        return jsonify({"success": False, "error": str(job.result)}), 400
+      return jsonify({"success": True, **job.result})
+
+    return jsonify({"success": True, "job_id": job.id, "status": job.state}), 202
+  except Exception as e:
+    return jsonify({"success": False, "error": str(e)}), 400
+
+
+@space_weather_bp.route("/ingest/<job_id>", methods=["GET"])
+def ingest_status(job_id):
+  """Report the state of a queued ingest job, with its summary once finished."""
+  if ingest_space_weather_task.app.conf.task_always_eager:
+    # No broker or result backend: POST /ingest runs inline and returns its summary directly
     return jsonify({
-      "success": True,
-      "ingested_events": len(rows),
-      "dataset": {
-        "name": meta.get("dataset_name"),
-        "time_range": meta.get("time_range"),
-        "parameters": meta.get("parameters"),
-      },
-    })
+      "success": False,
+      "error": "No result backend configured; ingest jobs run inline and are not tracked",
+    }), 404
+  try:
+    job = ingest_space_weather_task.AsyncResult(job_id)
+    response = {"success": True, "job_id": job_id, "status": job.state}
+    if job.successful():
+      response.update(job.result)
+    elif job.failed():
+      response["error"] = str(job.result)
+    return jsonify(response)
   except Exception as e:
-    db.session.rollback()
     return jsonify({"success": False, "error": str(e)}), 400
 
 
 @space_weather_bp.route("/events", methods=["GET"])
 def list_events():
   """List ingested major space-weather events from the DB.
-  Query params: start=YYYY-MM-DD (or ISO), end=YYYY-MM-DD (or ISO), limit=int
+  Query params: start=YYYY-MM-DD (or ISO), end=YYYY-MM-DD (or ISO), limit=int,
+  include_raw=1 to also return the stored solar_events payload
   """
   try:
     start_str = request.args.get("start")
     end_str = request.args.get("end")
     limit = int(request.args.get("limit", 200))
+    include_raw = request.args.get("include_raw") == "1"
 
-    q = SpaceWeather.query
+    params = {"limit": limit}
     if start_str:
-      q = q.filter(SpaceWeather.timestamp >= _parse_iso_date(start_str))
+      params["start"] = _parse_query_date(start_str)
     if end_str:
-      q = q.filter(SpaceWeather.timestamp <= _parse_iso_date(end_str))
-    q = q.order_by(SpaceWeather.timestamp.asc()).limit(limit)
+      params["end"] = _parse_query_date(end_str)
 
-    rows = q.all()
+    rows = db.session.execute(_events_stmt(bool(start_str), bool(end_str), include_raw), params).scalars().all()
     return jsonify({
       "success": True,
       "count": len(rows),
-      "events": [r.to_dict() for r in rows],
+      "events": [r.to_dict() if include_raw else r.to_summary_dict() for r in rows],
     })
   except Exception as e:
     return jsonify({"success": False, "error": str(e)}), 400
@@ -114,8 +115,7 @@ def list_events():
 def current_space_weather():
   """Return current space weather using service (simulated if no live feed)."""
   try:
-    svc = SpaceWeatherService()
-    current = svc.get_current_solar_activity()
+    current = _space_weather.get_current_solar_activity()
     return jsonify({"success": True, **current})
   except Exception as e:
     return jsonify({"success": False, "error": str(e)}), 400
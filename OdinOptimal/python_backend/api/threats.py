@@ -9,6 +9,10 @@ from services.space_weather import SpaceWeatherService
 
 threats_bp = Blueprint('threats', __name__)
 
+# Stateless services, built once per worker and shared across requests
+_threat_monitor = ThreatMonitor()
+_space_weather = SpaceWeatherService()
+
 @threats_bp.route('/analyze', methods=['POST'])
 def analyze_threats():
     """Analyze current and predicted threats"""
@@ -18,29 +22,28 @@ def analyze_threats():
         # Get mission trajectory and timeframe
         trajectory = data.get('trajectory')
         mission_id = data.get('mission_id')
-        start_time = datetime.fromisoformat(data.get('start_time', datetime.utcnow().isoformat()))
-        end_time = datetime.fromisoformat(data.get('end_time', (datetime.utcnow() + timedelta(days=3)).isoformat()))
-        
-        threat_monitor = ThreatMonitor()
-        space_weather = SpaceWeatherService()
+        # Only client-supplied bounds need parsing; defaults are built directly
+        now = datetime.utcnow()
+        start_time = datetime.fromisoformat(data['start_time']) if data.get('start_time') else now
+        end_time = datetime.fromisoformat(data['end_time']) if data.get('end_time') else now + timedelta(days=3)
         
         # Analyze different threat types
         threats = {
-            'solar_activity': space_weather.get_solar_activity_forecast(start_time, end_time),
-            'space_debris': threat_monitor.analyze_debris_risk(trajectory, start_time, end_time),
-            'radiation_exposure': threat_monitor.calculate_radiation_exposure(trajectory),
-            'communication_blackouts': threat_monitor.predict_comm_blackouts(trajectory, start_time, end_time)
+            'solar_activity': _space_weather.get_solar_activity_forecast(start_time, end_time),
+            'space_debris': _threat_monitor.analyze_debris_risk(trajectory, start_time, end_time),
+            'radiation_exposure': _threat_monitor.calculate_radiation_exposure(trajectory),
+            'communication_blackouts': _threat_monitor.predict_comm_blackouts(trajectory, start_time, end_time)
         }
         
         # Calculate overall risk score
-        risk_assessment = threat_monitor.calculate_overall_risk(threats)
+        risk_assessment = _threat_monitor.calculate_overall_risk(threats)
         
         return jsonify({
             'success': True,
             'threats': threats,
             'risk_assessment': risk_assessment,
-            'recommendations': threat_monitor.generate_recommendations(threats),
-            'critical_periods': threat_monitor.identify_critical_periods(threats, start_time, end_time)
+            'recommendations': _threat_monitor.generate_recommendations(threats),
+            'critical_periods': _threat_monitor.identify_critical_periods(threats, start_time, end_time)
         })
         
     except Exception as e:
@@ -53,10 +56,8 @@ def analyze_threats():
 def get_solar_activity():
     """Get current solar activity data"""
     try:
-        space_weather = SpaceWeatherService()
-        
         # Get current solar data
-        solar_data = space_weather.get_current_solar_activity()
+        solar_data = _space_weather.get_current_solar_activity()
         
         return jsonify({
             'success': True,
@@ -64,7 +65,7 @@ def get_solar_activity():
             'geomagnetic_index': solar_data.get('geomagnetic_index'),
             'solar_events': solar_data.get('solar_events', []),
             'last_updated': solar_data.get('timestamp'),
-            'forecast': space_weather.get_24h_forecast()
+            'forecast': _space_weather.get_24h_forecast()
         })
         
     except Exception as e:
@@ -81,8 +82,7 @@ def track_debris():
         trajectory = data.get('trajectory')
         time_window = data.get('time_window', 24)  # hours
         
-        threat_monitor = ThreatMonitor()
-        debris_analysis = threat_monitor.track_orbital_debris(trajectory, time_window)
+        debris_analysis = _threat_monitor.track_orbital_debris(trajectory, time_window)
         
         return jsonify({
             'success': True,
@@ -107,8 +107,7 @@ def calculate_radiation():
         crew_size = data.get('crew_size', 0)
         mission_duration = data.get('duration', 3.0)  # days
         
-        threat_monitor = ThreatMonitor()
-        radiation_analysis = threat_monitor.calculate_detailed_radiation_exposure(
+        radiation_analysis = _threat_monitor.calculate_detailed_radiation_exposure(
             trajectory, crew_size, mission_duration
         )
         
@@ -9,6 +9,10 @@ from services.lambert_solver import LambertSolver
 
 trajectory_bp = Blueprint('trajectory', __name__)
 
+# Stateless services, built once per worker and shared across requests
+_trajectory_engine = TrajectoryEngine()
+_lambert = LambertSolver()
+
 @trajectory_bp.route('/calculate', methods=['POST'])
 def calculate_trajectory():
     """Calculate optimal trajectory between two points"""
@@ -21,18 +25,15 @@ def calculate_trajectory():
         transfer_time = data.get('transfer_time', 3.0 * 24 * 3600)  # seconds (default 3 days)
         method = data.get('method', 'hohmann')  # hohmann, bi_elliptic, lambert
         
-        trajectory_engine = TrajectoryEngine()
-        
         if method == 'lambert':
             # Use Lambert's problem solver
-            lambert = LambertSolver()
-            result = lambert.solve(start_position, end_position, transfer_time)
+            result = _lambert.solve(start_position, end_position, transfer_time)
         elif method == 'hohmann':
             # Hohmann transfer optimization
-            result = trajectory_engine.calculate_hohmann_transfer(start_position, end_position)
+            result = _trajectory_engine.calculate_hohmann_transfer(start_position, end_position)
         elif method == 'bi_elliptic':
             # Bi-elliptic transfer
-            result = trajectory_engine.calculate_bi_elliptic_transfer(start_position, end_position)
+            result = _trajectory_engine.calculate_bi_elliptic_transfer(start_position, end_position)
         else:
             return jsonify({
                 'success': False,
@@ -67,8 +68,7 @@ def optimize_trajectory():
             'safety_score': data.get('safety_weight', 0.3)
         }
         
-        trajectory_engine = TrajectoryEngine()
-        result = trajectory_engine.multi_objective_optimization(
+        result = _trajectory_engine.multi_objective_optimization(
             start_pos=data.get('start_position'),
             end_pos=data.get('end_position'),
             constraints=data.get('constraints', {}),
@@ -95,8 +95,7 @@ def validate_trajectory():
         data = request.get_json()
         trajectory_data = data.get('trajectory')
         
-        trajectory_engine = TrajectoryEngine()
-        validation_result = trajectory_engine.validate_trajectory(trajectory_data)
+        validation_result = _trajectory_engine.validate_trajectory(trajectory_data)
         
         return jsonify({
             'success': True,
@@ -5,16 +5,20 @@ Main application entry point
 """
 
 import os
-from flask import Flask, jsonify
+import orjson
+from flask import Flask, Response, jsonify
 from flask_cors import CORS
 from dotenv import load_dotenv
-from database import db
+from database import db, convert_json_columns_to_jsonb, create_missing_indexes
+from celery_app import celery_init_app
+from serialization import OrjsonProvider
 
 # Load environment variables
 load_dotenv()
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Configure CORS to allow React frontend (include Vite dev server)
 cors_origins = [
@@ -30,18 +34,25 @@ if os.getenv('REPL_ID'):
 CORS(app, origins=cors_origins, supports_credentials=True)
 
 # Database configuration
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///site.db'
+# SQLite (WAL mode) for development; set DATABASE_URL to use Postgres in production
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///site.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Room for every statement shape the API issues in SQLAlchemy's compiled-SQL cache
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'query_cache_size': 1200}
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'odin-development-key')
 
+# Background jobs: Redis broker when REDIS_URL is set, otherwise tasks run inline
+redis_url = os.getenv('REDIS_URL')
+app.config['CELERY'] = {
+    'broker_url': redis_url,
+    'result_backend': redis_url,
+    'task_always_eager': not redis_url,
+    'task_ignore_result': True,
+}
+celery = celery_init_app(app)
+
 # Initialize database with app
 db.init_app(app)
-# Ensure tables exist both in dev and prod (WSGI)
-with app.app_context():
-    try:
-        db.create_all()
-    except Exception:
-        pass
 
 # Import and register API blueprints
 from api.missions import missions_bp
@@ -56,24 +67,36 @@ app.register_blueprint(threats_bp, url_prefix='/api/threats')
 app.register_blueprint(decisions_bp, url_prefix='/api/decisions')
 app.register_blueprint(space_weather_bp, url_prefix='/api/space-weather')
 
+# Schema creation is a deploy step (POST /api/admin/init-db); opt in to running it on every worker boot
+if os.getenv('ODIN_AUTO_CREATE') == '1':
+    with app.app_context():
+        try:
+            db.create_all()
+        except Exception:
+            pass
+
+# Static probe payloads, encoded once at import
+_HEALTH_BODY = orjson.dumps({
+    'status': 'healthy',
+    'service': 'ODIN Backend',
+    'version': '1.0.0'
+})
+_STATUS_BODY = orjson.dumps({
+    'database': 'connected',
+    'ai_engine': 'ready',
+    'trajectory_engine': 'initialized',
+    'threat_monitor': 'active'
+})
+
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'ODIN Backend',
-        'version': '1.0.0'
-    })
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 @app.route('/api/status')
 def system_status():
     """System status endpoint"""
-    return jsonify({
-        'database': 'connected',
-        'ai_engine': 'ready',
-        'trajectory_engine': 'initialized',
-        'threat_monitor': 'active'
-    })
+    return Response(_STATUS_BODY, mimetype='application/json')
 
 @app.route('/api/admin/init-db', methods=['POST','GET'])
 def init_db_endpoint():
@@ -81,6 +104,8 @@ def init_db_endpoint():
     try:
         with app.app_context():
             db.create_all()
+            convert_json_columns_to_jsonb()
+            create_missing_indexes()
         return jsonify({'success': True, 'message': 'Database tables created'})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -0,0 +1,18 @@
+"""
+Celery integration for ODIN background jobs
+"""
+
+from celery import Celery, Task
+
+def celery_init_app(app):
+    """Create a Celery app whose tasks run inside the Flask application context"""
+    class FlaskTask(Task):
+        def __call__(self, *args, **kwargs):
+            with app.app_context():
+                return self.run(*args, **kwargs)
+
+    celery = Celery(app.name, task_cls=FlaskTask)
+    celery.config_from_object(app.config["CELERY"])
+    celery.set_default()
+    app.extensions["celery"] = celery
+    return celery
@@ -2,7 +2,49 @@
 Centralized database configuration for ODIN system
 """
 
+import sqlite3
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import JSON, event, inspect, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Engine
 
 # Single database instance to be shared across all models
-db = SQLAlchemy()
\ No newline at end of file
+db = SQLAlchemy()
+
+# Binary, GIN-indexable JSONB on PostgreSQL; plain JSON elsewhere (e.g. local SQLite)
+JSONB = JSON().with_variant(postgresql.JSONB(), 'postgresql')
+
+@event.listens_for(Engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+    """WAL lets readers proceed during long ingest commits; mmap cuts read syscalls on range scans"""
+    if not isinstance(dbapi_conn, sqlite3.Connection):
+        return
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+def convert_json_columns_to_jsonb():
+    """On PostgreSQL, convert existing json columns now declared JSONB (create_all leaves existing tables alone)"""
+    if db.engine.dialect.name != 'postgresql':
+        return
+    inspector = inspect(db.engine)
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            current = {column['name']: column['type'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                existing = current.get(column.name)
+                if column.type is JSONB and isinstance(existing, postgresql.JSON) and not isinstance(existing, postgresql.JSONB):
+                    conn.execute(text(
+                        f'ALTER TABLE "{table.name}" ALTER COLUMN "{column.name}" TYPE jsonb USING "{column.name}"::jsonb'
+                    ))
+
+def create_missing_indexes():
+    """Create declared indexes missing on existing tables (create_all only indexes new tables)"""
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
\ No newline at end of file
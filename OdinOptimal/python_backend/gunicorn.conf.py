@@ -0,0 +1,13 @@
+"""
+Gunicorn configuration for production deployment
+gevent workers let outbound HTTP (dataset ingest) and DB I/O overlap across requests
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '3001')}"
+worker_class = 'gevent'
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_connections = 1000
+timeout = 60
@@ -3,8 +3,7 @@ AI Decision Database Model
 """
 
 from datetime import datetime
-from sqlalchemy.dialects.postgresql import JSON
-from database import db
+from database import db, JSONB
 
 class AIDecision(db.Model):
     """AI decision logging model"""
@@ -13,15 +12,24 @@ class AIDecision(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     mission_id = db.Column(db.Integer, db.ForeignKey('missions.id'))
     decision_type = db.Column(db.String(100), nullable=False)
-    context_data = db.Column(JSON)  # Input context for decision
-    decision_data = db.Column(JSON)  # The actual decision made
+    context_data = db.Column(JSONB)  # Input context for decision
+    decision_data = db.Column(JSONB)  # The actual decision made
     reasoning = db.Column(db.Text)  # AI's reasoning explanation
     confidence_score = db.Column(db.Float, default=0.0)  # 0.0 to 1.0
-    alternatives_considered = db.Column(JSON)  # Other options evaluated
-    trade_offs = db.Column(JSON)  # Trade-off analysis
+    alternatives_considered = db.Column(JSONB)  # Other options evaluated
+    trade_offs = db.Column(JSONB)  # Trade-off analysis
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
     implemented = db.Column(db.Boolean, default=False)
     
+    # Scalar columns only; list views skip the potentially large JSON columns
+    SUMMARY_FIELDS = ('id', 'mission_id', 'decision_type', 'reasoning',
+                      'confidence_score', 'timestamp', 'implemented')
+    
+    # Serves /decisions/history: filter by mission, newest first
+    __table_args__ = (
+        db.Index('ix_ai_decisions_mission_id_timestamp', mission_id, timestamp.desc()),
+    )
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -35,4 +43,4 @@ class AIDecision(db.Model):
             'trade_offs': self.trade_offs,
             'timestamp': self.timestamp.isoformat() if self.timestamp else None,
             'implemented': self.implemented
-        }
\ No newline at end of file
+        }
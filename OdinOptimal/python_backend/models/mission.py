@@ -3,8 +3,7 @@ Mission Database Model
 """
 
 from datetime import datetime
-from sqlalchemy.dialects.postgresql import JSON
-from database import db
+from database import db, JSONB
 
 class Mission(db.Model):
     """Mission tracking model"""
@@ -15,15 +14,24 @@ class Mission(db.Model):
     launch_date = db.Column(db.DateTime, nullable=False)
     arrival_date = db.Column(db.DateTime, nullable=True)
     status = db.Column(db.String(50), default='planning')  # planning, active, completed, aborted
-    trajectory_data = db.Column(JSON)
-    threat_events = db.Column(JSON)
-    decisions_log = db.Column(JSON)
+    trajectory_data = db.Column(JSONB)
+    threat_events = db.Column(JSONB)
+    decisions_log = db.Column(JSONB)
     fuel_capacity = db.Column(db.Float, default=1000.0)  # kg
     fuel_used = db.Column(db.Float, default=0.0)  # kg
     crew_size = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Scalar columns only; list views skip the potentially large JSON columns
+    SUMMARY_FIELDS = ('id', 'name', 'launch_date', 'arrival_date', 'status',
+                      'fuel_capacity', 'fuel_used', 'crew_size', 'created_at', 'updated_at')
+
+    # Serves /missions: keyset pages ordered by (created_at, id), newest first
+    __table_args__ = (
+        db.Index('ix_missions_created_at_id', created_at, id),
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -39,4 +47,4 @@ class Mission(db.Model):
             'crew_size': self.crew_size,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
\ No newline at end of file
+        }
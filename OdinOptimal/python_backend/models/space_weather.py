@@ -3,8 +3,7 @@ Space Weather Database Model
 """
 
 from datetime import datetime
-from sqlalchemy.dialects.postgresql import JSON
-from database import db
+from database import db, JSONB
 
 class SpaceWeather(db.Model):
     """Historical space weather data model"""
@@ -14,17 +13,42 @@ class SpaceWeather(db.Model):
     timestamp = db.Column(db.DateTime, nullable=False)
     solar_flux = db.Column(db.Float)  # Solar flux index
     geomagnetic_index = db.Column(db.Float)  # Kp index
-    solar_events = db.Column(JSON)  # Solar flares, CME events
+    solar_events = db.Column(JSONB)  # Solar flares, CME events
     radiation_level = db.Column(db.Float)  # Background radiation
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Scalar columns only; list views skip the raw solar_events payload
+    SUMMARY_FIELDS = ('id', 'timestamp', 'solar_flux', 'geomagnetic_index', 'radiation_level', 'created_at')
+    
+    # Serves timestamp range scans in /space-weather/events and forecast blending;
+    # the GIN index (PostgreSQL only) serves solar_events @> containment filters
+    __table_args__ = (
+        db.Index('ix_space_weather_timestamp', timestamp),
+        db.Index(
+            'ix_space_weather_solar_events_gin', solar_events,
+            postgresql_using='gin', postgresql_ops={'solar_events': 'jsonb_path_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
+    
     def to_dict(self):
+        timestamp, created_at = self.timestamp, self.created_at
         return {
             'id': self.id,
-            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
+            'timestamp': timestamp.isoformat() if timestamp else None,
             'solar_flux': self.solar_flux,
             'geomagnetic_index': self.geomagnetic_index,
             'solar_events': self.solar_events,
             'radiation_level': self.radiation_level,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': created_at.isoformat() if created_at else None
+        }
+    
+    def to_summary_dict(self):
+        timestamp, created_at = self.timestamp, self.created_at
+        return {
+            'id': self.id,
+            'timestamp': timestamp.isoformat() if timestamp else None,
+            'solar_flux': self.solar_flux,
+            'geomagnetic_index': self.geomagnetic_index,
+            'radiation_level': self.radiation_level,
+            'created_at': created_at.isoformat() if created_at else None
         }
\ No newline at end of file
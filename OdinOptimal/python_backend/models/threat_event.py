@@ -3,8 +3,7 @@ Threat Event Database Model
 """
 
 from datetime import datetime
-from sqlalchemy.dialects.postgresql import JSON
-from database import db
+from database import db, JSONB
 
 class ThreatEvent(db.Model):
     """Detected threat events model"""
@@ -15,13 +14,26 @@ class ThreatEvent(db.Model):
     threat_type = db.Column(db.String(100), nullable=False)  # solar_flare, debris, radiation
     severity = db.Column(db.String(20), default='low')  # low, medium, high, critical
     probability = db.Column(db.Float, default=0.0)  # 0.0 to 1.0
-    impact_data = db.Column(JSON)
-    mitigation_options = db.Column(JSON)
+    impact_data = db.Column(JSONB)
+    mitigation_options = db.Column(JSONB)
     detected_at = db.Column(db.DateTime, default=datetime.utcnow)
     predicted_time = db.Column(db.DateTime)  # When the threat will occur
     resolved = db.Column(db.Boolean, default=False)
     
+    # Open threats per mission, and upcoming threats by predicted time; the composite
+    # index also serves plain mission_id lookups through its leading column. The GIN
+    # index (PostgreSQL only) serves impact_data @> containment filters
+    __table_args__ = (
+        db.Index('ix_threat_events_mission_id_resolved', mission_id, resolved),
+        db.Index('ix_threat_events_predicted_time', predicted_time),
+        db.Index(
+            'ix_threat_events_impact_data_gin', impact_data,
+            postgresql_using='gin', postgresql_ops={'impact_data': 'jsonb_path_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
+    
     def to_dict(self):
+        detected_at, predicted_time = self.detected_at, self.predicted_time
         return {
             'id': self.id,
             'mission_id': self.mission_id,
@@ -30,7 +42,7 @@ class ThreatEvent(db.Model):
             'probability': self.probability,
             'impact_data': self.impact_data,
             'mitigation_options': self.mitigation_options,
-            'detected_at': self.detected_at.isoformat() if self.detected_at else None,
-            'predicted_time': self.predicted_time.isoformat() if self.predicted_time else None,
+            'detected_at': detected_at.isoformat() if detected_at else None,
+            'predicted_time': predicted_time.isoformat() if predicted_time else None,
             'resolved': self.resolved
         }
\ No newline at end of file
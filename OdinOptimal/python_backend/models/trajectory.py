@@ -3,8 +3,7 @@ Trajectory Database Model
 """
 
 from datetime import datetime
-from sqlalchemy.dialects.postgresql import JSON
-from database import db
+from database import db, JSONB
 
 class Trajectory(db.Model):
     """Calculated orbital trajectories model"""
@@ -13,9 +12,9 @@ class Trajectory(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     mission_id = db.Column(db.Integer, db.ForeignKey('missions.id'))
     trajectory_type = db.Column(db.String(50), nullable=False)  # hohmann, bi_elliptic, lambert
-    start_position = db.Column(JSON)  # [x, y, z] coordinates
-    end_position = db.Column(JSON)   # [x, y, z] coordinates
-    waypoints = db.Column(JSON)      # Array of trajectory points
+    start_position = db.Column(JSONB)  # [x, y, z] coordinates
+    end_position = db.Column(JSONB)   # [x, y, z] coordinates
+    waypoints = db.Column(JSONB)      # Array of trajectory points
     delta_v_total = db.Column(db.Float)  # Total velocity change required
     transfer_time = db.Column(db.Float)  # Time in seconds
     fuel_efficiency = db.Column(db.Float)  # Efficiency score 0-100
@@ -23,7 +22,14 @@ class Trajectory(db.Model):
     is_optimal = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Trajectories per mission and recent-first listings
+    __table_args__ = (
+        db.Index('ix_trajectories_mission_id', mission_id),
+        db.Index('ix_trajectories_created_at', created_at),
+    )
+    
     def to_dict(self):
+        created_at = self.created_at
         return {
             'id': self.id,
             'mission_id': self.mission_id,
@@ -36,5 +42,5 @@ class Trajectory(db.Model):
             'fuel_efficiency': self.fuel_efficiency,
             'safety_score': self.safety_score,
             'is_optimal': self.is_optimal,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': created_at.isoformat() if created_at else None
         }
\ No newline at end of file
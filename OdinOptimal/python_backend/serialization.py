@@ -0,0 +1,57 @@
+"""
+Fast JSON response helpers shared by ODIN API endpoints
+"""
+
+import dataclasses
+import decimal
+import uuid
+from datetime import date
+
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+from werkzeug.http import http_date
+
+def fast_json(payload, status=200):
+    """Serialize payload with orjson (native datetime/numpy support) into a JSON Response"""
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
+
+def _flask_default(o):
+    """Types orjson hands back to us, encoded the way Flask's default provider does"""
+    if isinstance(o, date):
+        return http_date(o)
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson; output matches the default provider (sorted keys,
+    HTTP-date datetimes) and numpy arrays/scalars serialize without .tolist()"""
+    
+    option = (
+        orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_SORT_KEYS
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_flask_default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_flask_default, option=self.option),
+            mimetype='application/json'
+        )
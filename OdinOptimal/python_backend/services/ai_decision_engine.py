@@ -8,51 +8,60 @@ import random
 from datetime import datetime
 from typing import Dict, List, Any
 
+# Static decision data, shared by every call and never mutated; kept as plain dicts
+# inside tuples so responses and the logged decision_data serialize as-is
+_DECISION_TEMPLATES = {
+    'trajectory_optimization': {
+        'criteria': ('fuel_efficiency', 'travel_time', 'safety_score'),
+        'weights': {'fuel_efficiency': 0.4, 'travel_time': 0.3, 'safety_score': 0.3}
+    }
+}
+
+_ALTERNATIVES = (
+    {
+        'name': 'Minimum Fuel Transfer',
+        'type': 'hohmann',
+        'fuel_efficiency': 95,
+        'travel_time': 72,
+        'safety_score': 85,
+        'evaluation_score': 0.88
+    },
+    {
+        'name': 'Fast Transfer', 
+        'type': 'bi_elliptic',
+        'fuel_efficiency': 75,
+        'travel_time': 48,
+        'safety_score': 80,
+        'evaluation_score': 0.76
+    }
+)
+
+# The alternatives are static, so the winner and its reasoning are fixed at import
+_BEST_IDX = max(range(len(_ALTERNATIVES)), key=lambda i: _ALTERNATIVES[i]['evaluation_score'])
+_BEST = _ALTERNATIVES[_BEST_IDX]
+_BEST_REASONING = f"Selected {_BEST['name']} based on optimal fuel efficiency and safety scores."
+
+_TRADE_OFFS = {
+    'fuel_vs_time': 'Optimized for fuel efficiency over speed',
+    'safety_factor': 'High safety margin maintained'
+}
+
 class AIDecisionEngine:
     """AI-powered decision engine for autonomous spacecraft operations"""
     
     def __init__(self):
-        self.decision_templates = {
-            'trajectory_optimization': {
-                'criteria': ['fuel_efficiency', 'travel_time', 'safety_score'],
-                'weights': {'fuel_efficiency': 0.4, 'travel_time': 0.3, 'safety_score': 0.3}
-            }
-        }
+        self.decision_templates = _DECISION_TEMPLATES
     
     def analyze_and_decide(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze situation and generate AI decision"""
         try:
             # Simple decision logic for now
-            alternatives = [
-                {
-                    'name': 'Minimum Fuel Transfer',
-                    'type': 'hohmann',
-                    'fuel_efficiency': 95,
-                    'travel_time': 72,
-                    'safety_score': 85,
-                    'evaluation_score': 0.88
-                },
-                {
-                    'name': 'Fast Transfer', 
-                    'type': 'bi_elliptic',
-                    'fuel_efficiency': 75,
-                    'travel_time': 48,
-                    'safety_score': 80,
-                    'evaluation_score': 0.76
-                }
-            ]
-            
-            best_alternative = max(alternatives, key=lambda x: x['evaluation_score'])
-            
             return {
-                'decision': best_alternative,
-                'reasoning': f"Selected {best_alternative['name']} based on optimal fuel efficiency and safety scores.",
+                'decision': _BEST,
+                'reasoning': _BEST_REASONING,
                 'confidence': 0.85,
-                'alternatives': alternatives,
-                'trade_offs': {
-                    'fuel_vs_time': 'Optimized for fuel efficiency over speed',
-                    'safety_factor': 'High safety margin maintained'
-                },
+                'alternatives': _ALTERNATIVES,
+                'trade_offs': _TRADE_OFFS,
                 'decision_type': 'trajectory_optimization',
                 'timestamp': datetime.utcnow().isoformat()
             }
@@ -0,0 +1,18 @@
+"""
+Error wrapping for ODIN service entry points
+Lets the numeric helpers raise natively while public methods keep their descriptive messages
+"""
+
+from functools import wraps
+
+def wrap_errors(message):
+    """Re-raise any failure of the decorated call as Exception(f"{message}: {error}")"""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                raise Exception(f"{message}: {str(e)}") from e
+        return wrapper
+    return decorator
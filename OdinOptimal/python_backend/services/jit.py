@@ -0,0 +1,23 @@
+"""
+Optional Numba JIT support for ODIN numeric kernels
+Falls back to plain Python execution when numba is not installed
+"""
+
+import threading
+
+# numba's default workqueue threading layer aborts the process when two threads launch
+# parallel=True kernels at once; callers hold this lock around every parallel launch
+parallel_lock = threading.Lock()
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable bare or with options"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
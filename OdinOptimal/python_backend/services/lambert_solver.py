@@ -5,7 +5,74 @@ Solves the two-point boundary value problem for orbital mechanics
 
 import numpy as np
 import math
-from scipy.optimize import fsolve
+from services.jit import njit, NUMBA_AVAILABLE
+
+def _sq3(v):
+    """Squared magnitude over the last axis of 3-vectors"""
+    return v[..., 0] * v[..., 0] + v[..., 1] * v[..., 1] + v[..., 2] * v[..., 2]
+
+def _norm3(v):
+    """Euclidean norm over the last axis of 3-vectors; cheaper than np.linalg.norm's generic dispatch"""
+    return np.sqrt(_sq3(v))
+
+@njit(cache=True, fastmath=True)
+def _lambert_universal(r1, r2, dtheta, t, mu, long_way, tol, max_iter):
+    """Newton iteration on the semi-major axis; returns -1.0 if the iterate leaves asin's domain"""
+    
+    # Initial guess for semi-major axis
+    c = math.sqrt(r1**2 + r2**2 - 2*r1*r2*math.cos(dtheta))
+    s = (r1 + r2 + c) / 2
+    a_min = s / 2
+    
+    # Initial guess
+    if t < math.pi * math.sqrt(2 * s**3 / (8 * mu)):
+        a_guess = a_min
+    else:
+        a_guess = a_min * 1.1
+    
+    # Newton-Raphson iteration to solve for semi-major axis
+    a = a_guess
+    for i in range(max_iter):
+        sin_half_alpha = math.sqrt(s / (2 * a))
+        if sin_half_alpha > 1.0:
+            return -1.0
+        alpha = 2 * math.asin(sin_half_alpha)
+        beta = 2 * math.asin(math.sqrt((s - c) / (2 * a)))
+        
+        if long_way:
+            alpha = 2 * math.pi - alpha
+        
+        # Shared by the time-of-flight equation and its derivative
+        phase = alpha - beta - (math.sin(alpha) - math.sin(beta))
+        sqrt_a3_mu = math.sqrt(a**3 / mu)
+        
+        t_calculated = sqrt_a3_mu * phase
+        
+        # Check convergence
+        if abs(t_calculated - t) < tol:
+            return a
+        
+        # Newton-Raphson update
+        dt_da = (3/2) * math.sqrt(a / mu) * phase
+        dt_da += sqrt_a3_mu * (1/math.sqrt(a)) * (math.cos(alpha) - math.cos(beta))
+        
+        if abs(dt_da) < tol:
+            break
+            
+        a = a - (t_calculated - t) / dt_da
+        
+        # Ensure positive semi-major axis
+        a = max(a, a_min * 0.9)
+    
+    return a
+
+@njit(cache=True)
+def _lambert_universal_batch(r1, r2, dtheta, t, mu, long_way, tol, max_iter):
+    """_lambert_universal over arrays of transfers; Newton converges per row, so this stays a loop"""
+    a = np.empty(r1.shape[0])
+    for i in range(r1.shape[0]):
+        a[i] = _lambert_universal(r1[i], r2[i], dtheta[i], t[i], mu, long_way[i], tol, max_iter)
+    return a
 
 class LambertSolver:
     """Solves Lambert's problem for trajectory planning"""
@@ -29,133 +96,127 @@ class LambertSolver:
             Dictionary with velocity vectors and trajectory parameters
         """
         try:
-            if mu is None:
-                mu = self.MU_EARTH
-                
-            # Convert to numpy arrays
-            r1 = np.array(r1_vec, dtype=float)
-            r2 = np.array(r2_vec, dtype=float)
-            
-            # Calculate magnitudes
-            r1_mag = np.linalg.norm(r1)
-            r2_mag = np.linalg.norm(r2)
-            
-            # Calculate delta theta (angle between position vectors)
-            cos_dtheta = np.dot(r1, r2) / (r1_mag * r2_mag)
-            cos_dtheta = np.clip(cos_dtheta, -1, 1)  # Avoid numerical errors
-            dtheta = math.acos(cos_dtheta)
-            
-            # Choose short or long way (default to short way)
-            if dtheta > math.pi:
-                dtheta = 2 * math.pi - dtheta
-                long_way = True
-            else:
-                long_way = False
-            
-            # Calculate chord length
-            c = np.linalg.norm(r2 - r1)
-            
-            # Calculate semi-perimeter
-            s = (r1_mag + r2_mag + c) / 2
-            
-            # Minimum energy transfer calculations
-            a_min = s / 2
-            
-            # Check if transfer time is feasible
-            if transfer_time <= 0:
-                raise ValueError("Transfer time must be positive")
-            
-            # Solve for semi-major axis using universal variable
-            a = self._solve_lambert_universal(r1_mag, r2_mag, dtheta, transfer_time, mu, long_way)
-            
-            # Calculate eccentricity and other orbital elements
-            f = 1 - a * (1 - math.cos(dtheta)) / r1_mag
-            g = transfer_time - math.sqrt(a**3 / mu) * (dtheta - math.sin(dtheta))
-            
-            # Calculate velocity vectors
-            v1 = (r2 - f * r1) / g
-            
-            f_dot = math.sqrt(mu / a) * math.tan(dtheta / 2) * ((1 - math.cos(dtheta)) / r1_mag - (1 - math.cos(dtheta)) / r2_mag) / 2
-            g_dot = 1 - a * (1 - math.cos(dtheta)) / r2_mag
-            
-            v2 = f_dot * r1 + g_dot * v1
+            batch = self.solve_batch([r1_vec], [r2_vec], [transfer_time], mu)
             
-            # Calculate orbital parameters
-            h_vec = np.cross(r1, v1)  # Angular momentum vector
-            h = np.linalg.norm(h_vec)
-            
-            # Energy and eccentricity
-            energy = np.dot(v1, v1) / 2 - mu / r1_mag
-            ecc_vec = np.cross(v1, h_vec) / mu - r1 / r1_mag
-            eccentricity = np.linalg.norm(ecc_vec)
-            
-            # Delta-V calculation
-            v1_circular = math.sqrt(mu / r1_mag)
-            v2_circular = math.sqrt(mu / r2_mag)
-            delta_v1 = np.linalg.norm(v1) - v1_circular
-            delta_v2 = abs(v2_circular - np.linalg.norm(v2))
-            delta_v_total = abs(delta_v1) + abs(delta_v2)
-            
-            # Fuel efficiency calculation
-            fuel_efficiency = max(0, 100 * (1 - delta_v_total / 15000))
+            if math.isnan(batch['semi_major_axis'][0]):
+                raise ValueError("Semi-major axis iteration left the valid domain")
             
             return {
-                'v1': v1.tolist(),
-                'v2': v2.tolist(),
-                'semi_major_axis': a,
-                'eccentricity': eccentricity,
-                'delta_v_total': delta_v_total,
-                'delta_v1': delta_v1,
-                'delta_v2': delta_v2,
+                'v1': batch['v1'][0],  # numpy; serialized directly by the orjson JSON provider
+                'v2': batch['v2'][0],
+                'semi_major_axis': float(batch['semi_major_axis'][0]),
+                'eccentricity': float(batch['eccentricity'][0]),
+                'delta_v_total': float(batch['delta_v_total'][0]),
+                'delta_v1': float(batch['delta_v1'][0]),
+                'delta_v2': float(batch['delta_v2'][0]),
                 'transfer_time': transfer_time,
-                'fuel_efficiency': fuel_efficiency,
-                'angular_momentum': h,
-                'energy': energy,
+                'fuel_efficiency': float(batch['fuel_efficiency'][0]),
+                'angular_momentum': float(batch['angular_momentum'][0]),
+                'energy': float(batch['energy'][0]),
                 'trajectory_type': 'lambert'
             }
             
         except Exception as e:
             raise Exception(f"Lambert solver failed: {str(e)}")
     
-    def _solve_lambert_universal(self, r1, r2, dtheta, t, mu, long_way=False):
-        """Solve Lambert's problem using universal variables"""
-        
-        # Initial guess for semi-major axis
-        c = math.sqrt(r1**2 + r2**2 - 2*r1*r2*math.cos(dtheta))
-        s = (r1 + r2 + c) / 2
-        a_min = s / 2
-        
-        # Initial guess
-        if t < math.pi * math.sqrt(2 * s**3 / (8 * mu)):
-            a_guess = a_min
-        else:
-            a_guess = a_min * 1.1
-        
-        # Newton-Raphson iteration to solve for semi-major axis
-        a = a_guess
-        for i in range(self.MAX_ITERATIONS):
-            alpha = 2 * math.asin(math.sqrt(s / (2 * a)))
-            beta = 2 * math.asin(math.sqrt((s - c) / (2 * a)))
+    def solve_batch(self, r1_vecs, r2_vecs, transfer_times, mu=None):
+        """
+        Solve Lambert's problem for N transfers at once
+        
+        Args:
+            r1_vecs: (N, 3) initial position vectors in meters
+            r2_vecs: (N, 3) final position vectors in meters
+            transfer_times: (N,) times of flight in seconds
+            mu: Gravitational parameter (defaults to Earth)
+        
+        Returns:
+            Dictionary of arrays keyed like solve(); 'v1' and 'v2' are (N, 3).
+            Rows whose iteration failed to stay in the valid domain are NaN.
+        """
+        if mu is None:
+            mu = self.MU_EARTH
+        
+        r1 = np.asarray(r1_vecs, dtype=np.float64).reshape(-1, 3)
+        r2 = np.asarray(r2_vecs, dtype=np.float64).reshape(-1, 3)
+        t = np.asarray(transfer_times, dtype=np.float64).reshape(-1)
+        
+        # Check if transfer times are feasible
+        if np.any(t <= 0):
+            raise ValueError("Transfer time must be positive")
+        
+        # Calculate magnitudes
+        r1_mag = _norm3(r1)
+        r2_mag = _norm3(r2)
+        
+        # Calculate delta theta (angle between position vectors)
+        cos_dtheta = np.einsum('ij,ij->i', r1, r2) / (r1_mag * r2_mag)
+        cos_dtheta = np.clip(cos_dtheta, -1, 1)  # Avoid numerical errors
+        dtheta = np.arccos(cos_dtheta)
+        
+        # Choose short or long way (default to short way)
+        long_way = dtheta > math.pi
+        dtheta = np.where(long_way, 2 * math.pi - dtheta, dtheta)
+        
+        # Solve for semi-major axis using universal variable
+        a = _lambert_universal_batch(r1_mag, r2_mag, dtheta, t, float(mu), long_way,
+                                     self.TOLERANCE, self.MAX_ITERATIONS)
+        a[a < 0] = np.nan
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Calculate eccentricity and other orbital elements
+            one_minus_cos = 1 - np.cos(dtheta)
+            f = 1 - a * one_minus_cos / r1_mag
+            g = t - np.sqrt(a**3 / mu) * (dtheta - np.sin(dtheta))
             
-            if long_way:
-                alpha = 2 * math.pi - alpha
+            # Calculate velocity vectors
+            v1 = (r2 - f[:, None] * r1) / g[:, None]
             
-            t_calculated = math.sqrt(a**3 / mu) * (alpha - beta - (math.sin(alpha) - math.sin(beta)))
+            f_dot = np.sqrt(mu / a) * np.tan(dtheta / 2) * (one_minus_cos / r1_mag - one_minus_cos / r2_mag) / 2
+            g_dot = 1 - a * one_minus_cos / r2_mag
             
-            # Check convergence
-            if abs(t_calculated - t) < self.TOLERANCE:
-                return a
+            v2 = f_dot[:, None] * r1 + g_dot[:, None] * v1
             
-            # Newton-Raphson update
-            dt_da = (3/2) * math.sqrt(a / mu) * (alpha - beta - (math.sin(alpha) - math.sin(beta)))
-            dt_da += math.sqrt(a**3 / mu) * (1/math.sqrt(a)) * (math.cos(alpha) - math.cos(beta))
+            # Speeds, each computed once; |v1|^2 also feeds the energy term
+            v1_sq = _sq3(v1)
+            v1_mag = np.sqrt(v1_sq)
+            v2_mag = _norm3(v2)
             
-            if abs(dt_da) < self.TOLERANCE:
-                break
-                
-            a = a - (t_calculated - t) / dt_da
+            # Calculate orbital parameters
+            h_vec = np.cross(r1, v1)  # Angular momentum vectors
+            h = _norm3(h_vec)
+            
+            # Energy and eccentricity
+            energy = v1_sq / 2 - mu / r1_mag
+            ecc_vec = np.cross(v1, h_vec) / mu - r1 / r1_mag[:, None]
+            eccentricity = _norm3(ecc_vec)
             
-            # Ensure positive semi-major axis
-            a = max(a, a_min * 0.9)
+            # Delta-V calculation
+            v1_circular = np.sqrt(mu / r1_mag)
+            v2_circular = np.sqrt(mu / r2_mag)
+            delta_v1 = v1_mag - v1_circular
+            delta_v2 = np.abs(v2_circular - v2_mag)
+            delta_v_total = np.abs(delta_v1) + np.abs(delta_v2)
+            
+            # Fuel efficiency calculation
+            fuel_efficiency = np.maximum(0, 100 * (1 - delta_v_total / 15000))
         
-        return a
\ No newline at end of file
+        return {
+            'v1': v1,
+            'v2': v2,
+            'semi_major_axis': a,
+            'eccentricity': eccentricity,
+            'delta_v_total': delta_v_total,
+            'delta_v1': delta_v1,
+            'delta_v2': delta_v2,
+            'transfer_time': t,
+            'fuel_efficiency': fuel_efficiency,
+            'angular_momentum': h,
+            'energy': energy,
+            'trajectory_type': 'lambert'
+        }
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from the on-disk cache) at import so the first request doesn't pay for it
+    _lambert_universal(7.0e6, 8.0e6, 1.0, 3600.0, 3.986004418e14, False, 1e-10, 1)
+    _lambert_universal_batch(np.full(1, 7.0e6), np.full(1, 8.0e6), np.ones(1), np.full(1, 3600.0),
+                             3.986004418e14, np.zeros(1, dtype=np.bool_), 1e-10, 1)
@@ -5,9 +5,36 @@ Provides space weather data and forecasting for mission planning
 
 import requests
 import random
+from bisect import bisect_right
+import numpy as np
 from datetime import datetime, timedelta
 from models.space_weather import SpaceWeather
 
+# Class boundaries; a value equal to a threshold falls in the class above it
+_FLARE_THRESHOLDS = np.array([150, 170, 200, 230])  # SFU
+_FLARE_CLASSES = np.array(['A', 'B', 'C', 'M', 'X'], dtype=object)
+_STORM_THRESHOLDS = np.array([5, 6, 7, 8])  # Kp
+_STORM_CLASSES = np.array(['minor', 'moderate', 'strong', 'severe', 'extreme'], dtype=object)
+
+# Combined flux/Kp risk score buckets: low, moderate, high, critical
+_RISK_THRESHOLDS = (0.3, 0.6, 0.8)
+_RISK_LEVELS = (0.1, 0.4, 0.7, 0.9)
+_RISK_LEVELS_ARRAY = np.array(_RISK_LEVELS)
+
+_FORECAST_STEP = timedelta(hours=6)  # 6-hour intervals
+
+# Shared generator for forecast noise; numpy serialises access to its bit generator
+_rng = np.random.default_rng()
+
+def _ar1(samples, prev_weight, new_weight):
+    """Temporal correlation: out[0] = samples[0], out[k] = out[k-1] * prev_weight + samples[k] * new_weight"""
+    out = np.array(samples, dtype=float)
+    if len(out) > 1:
+        from scipy.signal import lfilter  # deferred: scipy.signal adds ~0.7s to worker start-up
+
+        out[1:], _ = lfilter([new_weight], [1, -prev_weight], out[1:], zi=[prev_weight * out[0]])
+    return out
+
 class SpaceWeatherService:
     """Space weather monitoring and forecasting service"""
     
@@ -23,6 +50,7 @@ class SpaceWeatherService:
             # For now, simulating realistic space weather data
             
             current_time = datetime.utcnow()
+            current_iso = current_time.isoformat()
             
             # Simulate solar flux (realistic range: 70-300 SFU)
             solar_flux = random.uniform(75, 280)
@@ -36,7 +64,7 @@ class SpaceWeatherService:
                 solar_events.append({
                     'type': 'solar_flare',
                     'class': self._classify_solar_flare(solar_flux),
-                    'peak_time': current_time.isoformat(),
+                    'peak_time': current_iso,
                     'intensity': solar_flux,
                     'duration': random.randint(10, 180)  # minutes
                 })
@@ -59,7 +87,7 @@ class SpaceWeatherService:
                 })
             
             return {
-                'timestamp': current_time.isoformat(),
+                'timestamp': current_iso,
                 'solar_flux': solar_flux,
                 'geomagnetic_index': geomagnetic_index,
                 'solar_events': solar_events,
@@ -74,40 +102,36 @@ class SpaceWeatherService:
         """Get solar activity forecast for specified time period, blended with ingested events if available"""
         try:
             forecast_hours = int((end_time - start_time).total_seconds() / 3600)
-            forecast_data = []
-
-            current = start_time
-            while current <= end_time:
-                # Simulate baseline forecast with some randomness
-                base_flux = 120 + random.uniform(-30, 80)
-                base_kp = 2.5 + random.uniform(-1.5, 3.5)
-
-                # Add temporal correlation
-                if forecast_data:
-                    prev_flux = forecast_data[-1]['solar_flux']
-                    prev_kp = forecast_data[-1]['geomagnetic_index']
-                    base_flux = prev_flux * 0.8 + base_flux * 0.2
-                    base_kp = prev_kp * 0.7 + base_kp * 0.3
-
-                forecast_point = {
-                    'timestamp': current.isoformat(),
-                    'solar_flux': max(70, min(300, base_flux)),
-                    'geomagnetic_index': max(0, min(9, base_kp)),
-                    'confidence': random.uniform(0.6, 0.9)
-                }
-
-                # Add probability of significant events
-                if forecast_point['solar_flux'] > 180:
-                    forecast_point['flare_probability'] = random.uniform(0.2, 0.7)
-                if forecast_point['geomagnetic_index'] > 4:
-                    forecast_point['storm_probability'] = random.uniform(0.3, 0.8)
-
-                forecast_data.append(forecast_point)
-                current += timedelta(hours=6)  # 6-hour intervals
+            # Whole timeline as arrays: timestamps, noise, temporal correlation (as a filter), clipping
+            n_steps = (end_time - start_time) // _FORECAST_STEP + 1 if end_time >= start_time else 0
+            fc_times = np.datetime64(start_time.replace(tzinfo=None), 'us') + np.arange(n_steps) * np.timedelta64(_FORECAST_STEP)
+            flux = np.clip(_ar1(120 + _rng.uniform(-30, 80, n_steps), 0.8, 0.2), 70, 300)
+            kp = np.clip(_ar1(2.5 + _rng.uniform(-1.5, 3.5, n_steps), 0.7, 0.3), 0, 9)
+            confidences = _rng.uniform(0.6, 0.9, n_steps)
+            flare_probabilities = _rng.uniform(0.2, 0.7, n_steps)
+            storm_probabilities = _rng.uniform(0.3, 0.8, n_steps)
+
+            # Match datetime.isoformat(): microseconds only when non-zero, plus any UTC offset
+            timestamps = np.datetime_as_string(fc_times, unit='us' if start_time.microsecond else 's').tolist()
+            if start_time.tzinfo is not None:
+                offset = start_time.isoformat()[len(start_time.replace(tzinfo=None).isoformat()):]
+                timestamps = [ts + offset for ts in timestamps]
+
+            forecast_data = [
+                {'timestamp': ts, 'solar_flux': f, 'geomagnetic_index': k, 'confidence': c}
+                for ts, f, k, c in zip(timestamps, flux.tolist(), kp.tolist(), confidences.tolist())
+            ]
+
+            # Add probability of significant events
+            for i in np.flatnonzero(flux > 180).tolist():
+                forecast_data[i]['flare_probability'] = float(flare_probabilities[i])
+            for i in np.flatnonzero(kp > 4).tolist():
+                forecast_data[i]['storm_probability'] = float(storm_probabilities[i])
 
             # Blend historical ingested events into forecast and risk
             try:
                 events = SpaceWeather.query \
+                    .with_entities(SpaceWeather.timestamp, SpaceWeather.solar_events) \
                     .filter(SpaceWeather.timestamp >= start_time) \
                     .filter(SpaceWeather.timestamp <= end_time) \
                     .order_by(SpaceWeather.timestamp.asc()) \
@@ -115,12 +139,21 @@ class SpaceWeatherService:
             except Exception:
                 events = []
 
-            high_risk_periods = self._identify_high_risk_periods(forecast_data)
+            high_risk_periods = self._identify_high_risk_periods(forecast_data, flux, kp)
             if events:
+                # Nearest forecast point per event by binary search over the sorted forecast times;
+                # ties go to the earlier point
+                ev_times = np.array([ev_ts for ev_ts, _ in events], dtype='datetime64[us]')
+                idx = np.searchsorted(fc_times, ev_times)
+                left = np.clip(idx - 1, 0, len(fc_times) - 1)
+                right = np.clip(idx, 0, len(fc_times) - 1)
+                nearest_idx = np.where(
+                    np.abs(ev_times - fc_times[left]) <= np.abs(fc_times[right] - ev_times), left, right
+                ).tolist()
+
                 # Map events into high risk periods and nudge nearby forecast points
-                for ev in events:
-                    ev_ts = ev.timestamp
-                    ev_payload = ev.solar_events or {}
+                for (ev_ts, ev_payload), i in zip(events, nearest_idx):
+                    ev_payload = ev_payload or {}
                     severity = (ev_payload.get('severity') or '').lower()
                     risk_boost = {'low': 0.05, 'moderate': 0.12, 'medium': 0.12, 'high': 0.25, 'critical': 0.4}.get(severity, 0.1)
 
@@ -132,9 +165,10 @@ class SpaceWeatherService:
                     })
 
                     # Nudge nearest forecast point's indices upward slightly
-                    nearest = min(forecast_data, key=lambda p: abs(datetime.fromisoformat(p['timestamp']) - ev_ts))
+                    nearest = forecast_data[i]
                     nearest['solar_flux'] = min(300, nearest['solar_flux'] * (1.0 + risk_boost))
                     nearest['geomagnetic_index'] = min(9.0, nearest['geomagnetic_index'] * (1.0 + risk_boost * 0.6))
+                    flux[i], kp[i] = nearest['solar_flux'], nearest['geomagnetic_index']  # keep the summary arrays in step
 
             return {
                 'forecast_period': {
@@ -142,7 +176,7 @@ class SpaceWeatherService:
                     'end': end_time.isoformat()
                 },
                 'forecast_data': forecast_data,
-                'summary': self._generate_forecast_summary(forecast_data),
+                'summary': self._generate_forecast_summary(flux, kp),
                 'high_risk_periods': high_risk_periods,
                 'data_source': 'simulated+historical' if events else 'simulated'
             }
@@ -157,30 +191,12 @@ class SpaceWeatherService:
         return self.get_solar_activity_forecast(start_time, end_time)
     
     def _classify_solar_flare(self, solar_flux):
-        """Classify solar flare based on intensity"""
-        if solar_flux < 150:
-            return 'A'
-        elif solar_flux < 170:
-            return 'B'
-        elif solar_flux < 200:
-            return 'C'
-        elif solar_flux < 230:
-            return 'M'
-        else:
-            return 'X'
+        """Classify solar flare based on intensity (scalar or array)"""
+        return _FLARE_CLASSES[np.searchsorted(_FLARE_THRESHOLDS, solar_flux, side='right')]
     
     def _classify_geomagnetic_storm(self, kp_index):
-        """Classify geomagnetic storm based on Kp index"""
-        if kp_index < 5:
-            return 'minor'
-        elif kp_index < 6:
-            return 'moderate'
-        elif kp_index < 7:
-            return 'strong'
-        elif kp_index < 8:
-            return 'severe'
-        else:
-            return 'extreme'
+        """Classify geomagnetic storm based on Kp index (scalar or array)"""
+        return _STORM_CLASSES[np.searchsorted(_STORM_THRESHOLDS, kp_index, side='right')]
     
     def _calculate_risk_level(self, solar_flux, geomagnetic_index):
         """Calculate overall space weather risk level"""
@@ -189,19 +205,12 @@ class SpaceWeatherService:
         
         combined_risk = (flux_risk * 0.6 + geo_risk * 0.4)
         
-        if combined_risk < 0.3:
-            return 0.1  # Low risk
-        elif combined_risk < 0.6:
-            return 0.4  # Moderate risk
-        elif combined_risk < 0.8:
-            return 0.7  # High risk
-        else:
-            return 0.9  # Critical risk
+        return _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, combined_risk)]
     
-    def _generate_forecast_summary(self, forecast_data):
-        """Generate human-readable forecast summary"""
-        max_flux = max(point['solar_flux'] for point in forecast_data)
-        max_kp = max(point['geomagnetic_index'] for point in forecast_data)
+    def _generate_forecast_summary(self, flux, kp):
+        """Generate human-readable forecast summary from the forecast's flux and Kp arrays"""
+        max_flux = float(flux.max())
+        max_kp = float(kp.max())
         
         summary = []
         
@@ -219,20 +228,21 @@ class SpaceWeatherService:
         
         return summary
     
-    def _identify_high_risk_periods(self, forecast_data):
-        """Identify periods with elevated space weather risk"""
-        high_risk_periods = []
+    def _identify_high_risk_periods(self, forecast_data, flux, kp):
+        """Identify periods with elevated space weather risk; flux and kp are the points' values as arrays"""
+        # Same buckets as _calculate_risk_level, evaluated for every point at once
+        combined_risk = np.minimum(flux / 300, 1.0) * 0.6 + np.minimum(kp / 9, 1.0) * 0.4
+        risk_scores = _RISK_LEVELS_ARRAY[np.searchsorted(_RISK_THRESHOLDS, combined_risk, side='right')]
         
-        for i, point in enumerate(forecast_data):
-            risk_score = self._calculate_risk_level(point['solar_flux'], point['geomagnetic_index'])
-            
-            if risk_score > 0.6:  # High or critical risk
-                high_risk_periods.append({
-                    'timestamp': point['timestamp'],
-                    'risk_score': risk_score,
-                    'solar_flux': point['solar_flux'],
-                    'geomagnetic_index': point['geomagnetic_index'],
-                    'duration': '6 hours'  # Forecast interval
-                })
+        high_risk_periods = []
+        for i in np.flatnonzero(risk_scores > 0.6).tolist():  # High or critical risk
+            point = forecast_data[i]
+            high_risk_periods.append({
+                'timestamp': point['timestamp'],
+                'risk_score': float(risk_scores[i]),
+                'solar_flux': point['solar_flux'],
+                'geomagnetic_index': point['geomagnetic_index'],
+                'duration': '6 hours'  # Forecast interval
+            })
         
-        return high_risk_periods
+        return high_risk_periods
\ No newline at end of file
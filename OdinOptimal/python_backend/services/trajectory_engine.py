@@ -4,8 +4,117 @@ Implements orbital mechanics calculations for spacecraft trajectory planning
 """
 
 import numpy as np
-from scipy.optimize import minimize
 import math
+from functools import lru_cache
+from services.errors import wrap_errors
+from services.jit import njit, NUMBA_AVAILABLE
+
+def _radius(position):
+    """Magnitude of one [x, y, z] position; plain float math skips np.linalg.norm's dispatch"""
+    x, y, z = position
+    return math.sqrt(x*x + y*y + z*z)
+
+@njit(cache=True, fastmath=True)
+def _hohmann_core(r1_mag, r2_mag, sqrt_mu):
+    """Hohmann transfer between circular radii: (delta_v_total, delta_v1, delta_v2, transfer_time, a_transfer)"""
+    # Semi-major axis of transfer orbit
+    a_transfer = (r1_mag + r2_mag) / 2
+    inv_a = 1.0 / a_transfer
+    
+    # Velocities at transfer points
+    v1_transfer = sqrt_mu * math.sqrt(2.0/r1_mag - inv_a)
+    v2_transfer = sqrt_mu * math.sqrt(2.0/r2_mag - inv_a)
+    
+    # Circular velocities at start and end
+    v1_circular = sqrt_mu / math.sqrt(r1_mag)
+    v2_circular = sqrt_mu / math.sqrt(r2_mag)
+    
+    # Delta-V calculations; raising the orbit speeds up at both burns, lowering it slows down
+    if r2_mag > r1_mag:
+        delta_v1 = v1_transfer - v1_circular
+        delta_v2 = v2_circular - v2_transfer
+    else:
+        delta_v1 = v1_circular - v1_transfer
+        delta_v2 = v2_transfer - v2_circular
+    delta_v_total = delta_v1 + delta_v2
+    
+    # Transfer time (half orbit period)
+    transfer_time = math.pi * math.sqrt(a_transfer) * a_transfer / sqrt_mu
+    
+    return delta_v_total, delta_v1, delta_v2, transfer_time, a_transfer
+
+@njit(cache=True, fastmath=True)
+def _bi_elliptic_core(r1, r2, r_intermediate, sqrt_mu):
+    """Bi-elliptic transfer via r_intermediate: (delta_v_total, delta_v1, delta_v2, delta_v3, transfer_time)"""
+    # First transfer (to intermediate orbit)
+    a1 = (r1 + r_intermediate) / 2
+    inv_a1 = 1.0 / a1
+    v1_transfer1 = sqrt_mu * math.sqrt(2.0/r1 - inv_a1)
+    v1_circular = sqrt_mu / math.sqrt(r1)
+    delta_v1 = v1_transfer1 - v1_circular  # r_intermediate is above r1, so this burn always speeds up
+    time1 = math.pi * math.sqrt(a1) * a1 / sqrt_mu
+    
+    # Second transfer (from intermediate to final orbit)
+    a2 = (r_intermediate + r2) / 2
+    inv_a2 = 1.0 / a2
+    two_over_r_int = 2.0 / r_intermediate
+    v_intermediate1 = sqrt_mu * math.sqrt(two_over_r_int - inv_a1)
+    v_intermediate2 = sqrt_mu * math.sqrt(two_over_r_int - inv_a2)
+    delta_v2 = v_intermediate2 - v_intermediate1 if r2 > r1 else v_intermediate1 - v_intermediate2
+    time2 = math.pi * math.sqrt(a2) * a2 / sqrt_mu
+    
+    # Final velocity change
+    v2_transfer = sqrt_mu * math.sqrt(2.0/r2 - inv_a2)
+    v2_circular = sqrt_mu / math.sqrt(r2)
+    delta_v3 = v2_transfer - v2_circular  # r2 is the periapsis of the second ellipse, so this burn always slows down
+    
+    return delta_v1 + delta_v2 + delta_v3, delta_v1, delta_v2, delta_v3, time1 + time2
+
+# Objective order for optimization feature vectors and weight arrays
+_OBJECTIVES = ('fuel_efficiency', 'travel_time', 'safety_score')
+_TIME_NORMALIZATION = 7 * 24 * 3600  # Normalize to 7 days
+_SAFETY_SCORE = 0.8  # Simplified safety score
+
+def _score_transfers(fuel_efficiency, transfer_time, weights):
+    """Weighted objective scores for any shape of transfer metrics, as one einsum over the feature axis"""
+    fuel_efficiency = np.asarray(fuel_efficiency, dtype=np.float64)
+    transfer_time = np.asarray(transfer_time, dtype=np.float64)
+    
+    # Normalize metrics (0-1 scale)
+    features = np.stack([
+        fuel_efficiency / 100,
+        np.maximum(0, 1 - transfer_time / _TIME_NORMALIZATION),
+        np.full(fuel_efficiency.shape, _SAFETY_SCORE)
+    ], axis=-1)
+    weight_arr = np.array([weights[name] for name in _OBJECTIVES], dtype=np.float64)
+    
+    return np.einsum('...k,k->...', features, weight_arr)
+
+def _bi_elliptic_intermediate(r1, r2):
+    """Optimal intermediate radius (typically 2-3 times the larger radius)"""
+    return 2.5 * max(r1, r2)
+
+def _hohmann_fuel_efficiency(delta_v_total):
+    """Fuel efficiency calculation (inverse of delta-V)"""
+    return max(0, 100 * (1 - delta_v_total / 15000))  # Normalized
+
+def _bi_elliptic_fuel_efficiency(delta_v_total):
+    """Fuel efficiency of a bi-elliptic transfer, normalized to a larger delta-V budget"""
+    return max(0, 100 * (1 - delta_v_total / 18000))
+
+@lru_cache(maxsize=4096)
+def _score_pair(r1_mag, r2_mag, sqrt_mu, fuel_weight, time_weight, safety_weight):
+    """Hohmann and bi-elliptic kernel results for one radius pair, with their weighted scores"""
+    hohmann = _hohmann_core(r1_mag, r2_mag, sqrt_mu)
+    r_intermediate = _bi_elliptic_intermediate(r1_mag, r2_mag)
+    bi_elliptic = _bi_elliptic_core(r1_mag, r2_mag, r_intermediate, sqrt_mu)
+    
+    scores = _score_transfers(
+        [_hohmann_fuel_efficiency(hohmann[0]), _bi_elliptic_fuel_efficiency(bi_elliptic[0])],
+        [hohmann[3], bi_elliptic[4]],
+        dict(zip(_OBJECTIVES, (fuel_weight, time_weight, safety_weight)))
+    )
+    return hohmann, bi_elliptic, r_intermediate, tuple(scores.tolist())
 
 class TrajectoryEngine:
     """Core trajectory planning and optimization engine"""
@@ -17,175 +126,116 @@ class TrajectoryEngine:
         self.EARTH_RADIUS = 6371000     # Earth radius (m)
         self.MOON_RADIUS = 1737400      # Moon radius (m)
         self.EARTH_MOON_DISTANCE = 384400000  # Average Earth-Moon distance (m)
+        self._SQRT_MU_EARTH = math.sqrt(self.MU_EARTH)  # Shared factor of every orbital speed
     
+    @wrap_errors("Hohmann transfer calculation failed")
     def calculate_hohmann_transfer(self, start_pos, end_pos):
         """Calculate Hohmann transfer orbit between two positions"""
-        try:
-            # Convert positions to numpy arrays
-            r1 = np.array(start_pos)
-            r2 = np.array(end_pos)
-            
-            # Calculate orbital radii
-            r1_mag = np.linalg.norm(r1)
-            r2_mag = np.linalg.norm(r2)
-            
-            # Semi-major axis of transfer orbit
-            a_transfer = (r1_mag + r2_mag) / 2
-            
-            # Velocities at transfer points
-            v1_transfer = math.sqrt(self.MU_EARTH * (2/r1_mag - 1/a_transfer))
-            v2_transfer = math.sqrt(self.MU_EARTH * (2/r2_mag - 1/a_transfer))
-            
-            # Circular velocities at start and end
-            v1_circular = math.sqrt(self.MU_EARTH / r1_mag)
-            v2_circular = math.sqrt(self.MU_EARTH / r2_mag)
-            
-            # Delta-V calculations
-            delta_v1 = abs(v1_transfer - v1_circular)
-            delta_v2 = abs(v2_circular - v2_transfer)
-            delta_v_total = delta_v1 + delta_v2
-            
-            # Transfer time (half orbit period)
-            transfer_time = math.pi * math.sqrt(a_transfer**3 / self.MU_EARTH)
-            
-            # Fuel efficiency calculation (inverse of delta-V)
-            fuel_efficiency = max(0, 100 * (1 - delta_v_total / 15000))  # Normalized
-            
-            return {
-                'delta_v_total': delta_v_total,
-                'delta_v1': delta_v1,
-                'delta_v2': delta_v2,
-                'transfer_time': transfer_time,
-                'fuel_efficiency': fuel_efficiency,
-                'semi_major_axis': a_transfer,
-                'trajectory_type': 'hohmann'
-            }
-            
-        except Exception as e:
-            raise Exception(f"Hohmann transfer calculation failed: {str(e)}")
+        # Calculate orbital radii
+        r1_mag = _radius(start_pos)
+        r2_mag = _radius(end_pos)
+        
+        return self._hohmann_result(_hohmann_core(r1_mag, r2_mag, self._SQRT_MU_EARTH))
     
+    @wrap_errors("Bi-elliptic transfer calculation failed")
     def calculate_bi_elliptic_transfer(self, start_pos, end_pos):
         """Calculate bi-elliptic transfer orbit"""
-        try:
-            r1 = np.linalg.norm(start_pos)
-            r2 = np.linalg.norm(end_pos)
-            
-            # Optimal intermediate radius (typically 2-3 times the larger radius)
-            r_intermediate = 2.5 * max(r1, r2)
-            
-            # First transfer (to intermediate orbit)
-            a1 = (r1 + r_intermediate) / 2
-            v1_transfer1 = math.sqrt(self.MU_EARTH * (2/r1 - 1/a1))
-            v1_circular = math.sqrt(self.MU_EARTH / r1)
-            delta_v1 = abs(v1_transfer1 - v1_circular)
-            time1 = math.pi * math.sqrt(a1**3 / self.MU_EARTH)
-            
-            # Second transfer (from intermediate to final orbit)
-            a2 = (r_intermediate + r2) / 2
-            v_intermediate1 = math.sqrt(self.MU_EARTH * (2/r_intermediate - 1/a1))
-            v_intermediate2 = math.sqrt(self.MU_EARTH * (2/r_intermediate - 1/a2))
-            delta_v2 = abs(v_intermediate2 - v_intermediate1)
-            time2 = math.pi * math.sqrt(a2**3 / self.MU_EARTH)
-            
-            # Final velocity change
-            v2_transfer = math.sqrt(self.MU_EARTH * (2/r2 - 1/a2))
-            v2_circular = math.sqrt(self.MU_EARTH / r2)
-            delta_v3 = abs(v2_circular - v2_transfer)
-            
-            delta_v_total = delta_v1 + delta_v2 + delta_v3
-            transfer_time = time1 + time2
-            fuel_efficiency = max(0, 100 * (1 - delta_v_total / 18000))
-            
-            return {
-                'delta_v_total': delta_v_total,
-                'delta_v1': delta_v1,
-                'delta_v2': delta_v2,
-                'delta_v3': delta_v3,
-                'transfer_time': transfer_time,
-                'fuel_efficiency': fuel_efficiency,
-                'intermediate_radius': r_intermediate,
-                'trajectory_type': 'bi_elliptic'
-            }
-            
-        except Exception as e:
-            raise Exception(f"Bi-elliptic transfer calculation failed: {str(e)}")
+        r1 = _radius(start_pos)
+        r2 = _radius(end_pos)
+        
+        r_intermediate = _bi_elliptic_intermediate(r1, r2)
+        
+        return self._bi_elliptic_result(_bi_elliptic_core(r1, r2, r_intermediate, self._SQRT_MU_EARTH), r_intermediate)
     
+    @wrap_errors("Multi-objective optimization failed")
     def multi_objective_optimization(self, start_pos, end_pos, constraints, weights):
         """Multi-objective trajectory optimization"""
-        try:
-            # Calculate different transfer options
-            hohmann = self.calculate_hohmann_transfer(start_pos, end_pos)
-            bi_elliptic = self.calculate_bi_elliptic_transfer(start_pos, end_pos)
-            
-            alternatives = [hohmann, bi_elliptic]
-            
-            # Score each alternative based on weighted criteria
-            best_score = -1
-            optimal_trajectory = None
-            
-            for trajectory in alternatives:
-                # Normalize metrics (0-1 scale)
-                fuel_score = trajectory['fuel_efficiency'] / 100
-                time_score = max(0, 1 - trajectory['transfer_time'] / (7 * 24 * 3600))  # Normalize to 7 days
-                safety_score = 0.8  # Simplified safety score
-                
-                # Calculate weighted score
-                total_score = (
-                    weights['fuel_efficiency'] * fuel_score +
-                    weights['travel_time'] * time_score +
-                    weights['safety_score'] * safety_score
-                )
-                
-                trajectory['optimization_score'] = total_score
-                
-                if total_score > best_score:
-                    best_score = total_score
-                    optimal_trajectory = trajectory
-            
-            return {
-                'optimal_trajectory': optimal_trajectory,
-                'alternatives': alternatives,
-                'trade_offs': {
-                    'best_fuel_efficiency': max(alt['fuel_efficiency'] for alt in alternatives),
-                    'shortest_time': min(alt['transfer_time'] for alt in alternatives),
-                    'optimization_weights': weights
-                }
+        # Calculate and score the different transfer options; repeat queries are served from the cache
+        weight_values = tuple(float(weights[name]) for name in _OBJECTIVES)
+        hohmann_core, bi_elliptic_core, r_intermediate, scores = _score_pair(
+            _radius(start_pos), _radius(end_pos), self._SQRT_MU_EARTH, *weight_values
+        )
+        
+        alternatives = [
+            self._hohmann_result(hohmann_core),
+            self._bi_elliptic_result(bi_elliptic_core, r_intermediate)
+        ]
+        for trajectory, total_score in zip(alternatives, scores):
+            trajectory['optimization_score'] = total_score
+        
+        best = scores.index(max(scores))
+        optimal_trajectory = alternatives[best]
+        
+        return {
+            'optimal_trajectory': optimal_trajectory,
+            'alternatives': alternatives,
+            'trade_offs': {
+                'best_fuel_efficiency': max(alt['fuel_efficiency'] for alt in alternatives),
+                'shortest_time': min(alt['transfer_time'] for alt in alternatives),
+                'optimization_weights': weights
             }
-            
-        except Exception as e:
-            raise Exception(f"Multi-objective optimization failed: {str(e)}")
+        }
+    
+    def _hohmann_result(self, core):
+        """Response dict for a _hohmann_core result"""
+        delta_v_total, delta_v1, delta_v2, transfer_time, a_transfer = core
+        return {
+            'delta_v_total': delta_v_total,
+            'delta_v1': delta_v1,
+            'delta_v2': delta_v2,
+            'transfer_time': transfer_time,
+            'fuel_efficiency': _hohmann_fuel_efficiency(delta_v_total),
+            'semi_major_axis': a_transfer,
+            'trajectory_type': 'hohmann'
+        }
     
+    def _bi_elliptic_result(self, core, r_intermediate):
+        """Response dict for a _bi_elliptic_core result"""
+        delta_v_total, delta_v1, delta_v2, delta_v3, transfer_time = core
+        return {
+            'delta_v_total': delta_v_total,
+            'delta_v1': delta_v1,
+            'delta_v2': delta_v2,
+            'delta_v3': delta_v3,
+            'transfer_time': transfer_time,
+            'fuel_efficiency': _bi_elliptic_fuel_efficiency(delta_v_total),
+            'intermediate_radius': r_intermediate,
+            'trajectory_type': 'bi_elliptic'
+        }
+    
+    @wrap_errors("Trajectory validation failed")
     def validate_trajectory(self, trajectory_data):
         """Validate trajectory for safety and feasibility"""
-        try:
-            issues = []
-            recommendations = []
-            safety_score = 100
-            
-            # Check delta-V requirements
-            if trajectory_data.get('delta_v_total', 0) > 20000:  # m/s
-                issues.append("Excessive delta-V requirement")
-                safety_score -= 30
-                recommendations.append("Consider alternative trajectory with lower fuel requirements")
-            
-            # Check transfer time
-            if trajectory_data.get('transfer_time', 0) > 10 * 24 * 3600:  # 10 days
-                issues.append("Extended transfer time increases risk")
-                safety_score -= 20
-                recommendations.append("Optimize for shorter transfer time")
-            
-            # Check fuel efficiency
-            if trajectory_data.get('fuel_efficiency', 100) < 50:
-                issues.append("Low fuel efficiency")
-                safety_score -= 25
-                recommendations.append("Improve trajectory optimization")
-            
-            return {
-                'is_valid': safety_score >= 50,
-                'issues': issues,
-                'recommendations': recommendations,
-                'safety_score': max(0, safety_score)
-            }
-            
-        except Exception as e:
-            raise Exception(f"Trajectory validation failed: {str(e)}")
\ No newline at end of file
+        issues = []
+        recommendations = []
+        safety_score = 100
+        
+        # Check delta-V requirements
+        if trajectory_data.get('delta_v_total', 0) > 20000:  # m/s
+            issues.append("Excessive delta-V requirement")
+            safety_score -= 30
+            recommendations.append("Consider alternative trajectory with lower fuel requirements")
+        
+        # Check transfer time
+        if trajectory_data.get('transfer_time', 0) > 10 * 24 * 3600:  # 10 days
+            issues.append("Extended transfer time increases risk")
+            safety_score -= 20
+            recommendations.append("Optimize for shorter transfer time")
+        
+        # Check fuel efficiency
+        if trajectory_data.get('fuel_efficiency', 100) < 50:
+            issues.append("Low fuel efficiency")
+            safety_score -= 25
+            recommendations.append("Improve trajectory optimization")
+        
+        return {
+            'is_valid': safety_score >= 50,
+            'issues': issues,
+            'recommendations': recommendations,
+            'safety_score': max(0, safety_score)
+        }
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from the on-disk cache) at import so the first request doesn't pay for it
+    _hohmann_core(7.0e6, 8.0e6, 2.0e7)
+    _bi_elliptic_core(7.0e6, 8.0e6, 2.0e7, 2.0e7)
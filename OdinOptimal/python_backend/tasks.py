@@ -0,0 +1,11 @@
+"""
+ODIN background tasks
+"""
+
+from celery import shared_task
+from services.space_weather_ingest import ingest_dataset
+
+@shared_task(ignore_result=False)
+def ingest_space_weather_task(url):
+    """Download and store a historical space weather dataset"""
+    return ingest_dataset(url)
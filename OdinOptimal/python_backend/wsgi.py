@@ -2,6 +2,10 @@
 WSGI entry point for production deployment
 """
 
+# Make socket/ssl cooperative before requests and SQLAlchemy are imported
+from gevent import monkey
+monkey.patch_all()
+
 from app import app
 
 if __name__ == "__main__":